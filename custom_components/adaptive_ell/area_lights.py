@@ -0,0 +1,29 @@
+"""Resolve the light entities in an area for the config flow and the coordinator."""
+from __future__ import annotations
+
+from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry, entity_registry
+
+
+@callback
+def async_get_area_lights(
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_id: str
+) -> tuple[str, ...]:
+    """Get enabled lights in an area, by their own or their device's area."""
+    entries = list(entity_registry.async_entries_for_area(ent_reg, area_id))
+    
+    for device in device_registry.async_entries_for_area(dev_reg, area_id):
+        # An area set on the entity overrides its device's area, so entities with
+        # their own area were either matched above or belong elsewhere
+        entries.extend(
+            entry for entry in entity_registry.async_entries_for_device(ent_reg, device.id)
+            if not entry.area_id
+        )
+    
+    return tuple(
+        entry.entity_id for entry in entries
+        if entry.domain == LIGHT_DOMAIN and not entry.disabled
+    )
@@ -14,6 +14,7 @@ Restore light states after calibration.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict
 
@@ -79,42 +80,60 @@ async def restore_initial_states(
     
     restoration_results = {}
     
+    # Lights going back to identical settings share one service call
+    restore_groups: Dict[tuple, list[str]] = {}
+    
     for light_entity, saved_state in initial_states.items():
-        try:
-            if saved_state["state"] == STATE_OFF:
-                await hass.services.async_call(
-                    LIGHT_DOMAIN, "turn_off", {"entity_id": light_entity}
-                )
-                _LOGGER.debug("Restored %s to OFF", light_entity)
-            else:
-                service_data = {"entity_id": light_entity}
-                
-                # Restore brightness
-                if saved_state.get("brightness"):
-                    service_data["brightness"] = saved_state["brightness"]
-                
-                # Restore color (prioritize rgb, then color_temp, then other formats)
-                if saved_state.get("rgb_color"):
-                    service_data["rgb_color"] = saved_state["rgb_color"]
-                elif saved_state.get("color_temp"):
-                    service_data["color_temp"] = saved_state["color_temp"]
-                elif saved_state.get("color_temp_kelvin"):
-                    service_data["color_temp_kelvin"] = saved_state["color_temp_kelvin"]
-                elif saved_state.get("hs_color"):
-                    service_data["hs_color"] = saved_state["hs_color"]
-                elif saved_state.get("xy_color"):
-                    service_data["xy_color"] = saved_state["xy_color"]
-                
-                await hass.services.async_call(
-                    LIGHT_DOMAIN, "turn_on", service_data
-                )
-                _LOGGER.debug("Restored %s to ON with attributes", light_entity)
+        service_data = {}
+        
+        if saved_state["state"] == STATE_OFF:
+            service = "turn_off"
+        else:
+            service = "turn_on"
             
-            restoration_results[light_entity] = "success"
-                
-        except Exception as err:
-            _LOGGER.error("Failed to restore %s: %s", light_entity, err)
-            restoration_results[light_entity] = "failed"
+            # Restore brightness
+            if saved_state.get("brightness"):
+                service_data["brightness"] = saved_state["brightness"]
+            
+            # Restore color (prioritize rgb, then color_temp, then other formats)
+            if saved_state.get("rgb_color"):
+                service_data["rgb_color"] = saved_state["rgb_color"]
+            elif saved_state.get("color_temp"):
+                service_data["color_temp"] = saved_state["color_temp"]
+            elif saved_state.get("color_temp_kelvin"):
+                service_data["color_temp_kelvin"] = saved_state["color_temp_kelvin"]
+            elif saved_state.get("hs_color"):
+                service_data["hs_color"] = saved_state["hs_color"]
+            elif saved_state.get("xy_color"):
+                service_data["xy_color"] = saved_state["xy_color"]
+        
+        group_key = (service, tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in service_data.items()
+        ))
+        restore_groups.setdefault(group_key, []).append(light_entity)
+    
+    # The groups are independent, so their service calls run concurrently
+    results = await asyncio.gather(
+        *(
+            hass.services.async_call(
+                LIGHT_DOMAIN, service, {"entity_id": light_entities, **dict(data_items)}
+            )
+            for (service, data_items), light_entities in restore_groups.items()
+        ),
+        return_exceptions=True
+    )
+    
+    for ((service, data_items), light_entities), result in zip(restore_groups.items(), results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Failed to restore %s: %s", light_entities, result)
+            status = "failed"
+        else:
+            _LOGGER.debug("Restored %s with %s %s", light_entities, service, dict(data_items))
+            status = "success"
+        
+        for light_entity in light_entities:
+            restoration_results[light_entity] = status
     
     # Summary logging
     success_count = sum(1 for status in restoration_results.values() if status == "success")
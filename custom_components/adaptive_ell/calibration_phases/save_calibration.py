@@ -14,11 +14,11 @@ Save calibration data to persistent storage.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ async def save_calibration_data(
     
     try:
         calibration_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": dt_util.utcnow().isoformat(timespec="seconds"),
             "room_name": room_name,
             "min_lux": min_lux,
             "max_lux": max_lux,
@@ -70,16 +70,17 @@ async def save_calibration_data(
             )
         }
         
-        # Log summary
-        _LOGGER.info("Calibration summary:")
-        _LOGGER.info("  Room: %s", room_name)
-        _LOGGER.info("  Contributing lights: %d", len(light_contributions))
-        _LOGGER.info("  Excluded lights: %d", len(excluded_lights))
-        _LOGGER.info("  Lux range: %.1f - %.1f", min_lux, max_lux)
-        _LOGGER.info("  Total contribution: %.1f lux", calibration_data["total_contribution_lux"])
+        # Log summary (skip the handler dispatches entirely when INFO is off)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Calibration summary:")
+            _LOGGER.info("  Room: %s", room_name)
+            _LOGGER.info("  Contributing lights: %d", len(light_contributions))
+            _LOGGER.info("  Excluded lights: %d", len(excluded_lights))
+            _LOGGER.info("  Lux range: %.1f - %.1f", min_lux, max_lux)
+            _LOGGER.info("  Total contribution: %.1f lux", calibration_data["total_contribution_lux"])
         
         # Update config entry data
-        new_data = {**config_entry.data, "calibration": calibration_data}
+        new_data = config_entry.data | {"calibration": calibration_data}
         hass.config_entries.async_update_entry(config_entry, data=new_data)
         
         _LOGGER.info("✓ Calibration data saved successfully")
@@ -10,6 +10,7 @@ KNOWN ISSUES:
 - No retry logic for lights that fail to respond
 - No progressive timeout adjustment for slow-responding lights
 - Fails silently when light doesn't reach expected state
+- Group screening assumes lights only ever add light (no negative contributions)
 
 Test individual light contributions to room illumination.
 """
@@ -26,6 +27,72 @@ _LOGGER = logging.getLogger(__name__)
 # Contribution threshold - lights below this are ignored
 CONTRIBUTION_THRESHOLD_LUX = 10
 
+# Large light sets are first screened in groups of this size: if a whole group
+# stays below the threshold, none of its lights can pass individually
+SCREENING_GROUP_SIZE = 4
+SCREENING_MIN_LIGHTS = 8
+
+# Lights tested between re-measurements of the all-off base lux
+BASE_REFRESH_INTERVAL = 5
+
+
+async def _screen_light_groups(
+    light_entities: list[str],
+    settle_time_seconds: int,
+    set_lights_func: Callable,
+    set_light_func: Callable,
+    read_sensor_func: Callable
+) -> list[str]:
+    """
+    Drop lights whose whole group contributes less than the threshold.
+    
+    Relies on the additivity the pair validation phase checks: a group's
+    combined contribution bounds each member's own contribution.
+    
+    Returns:
+        Lights that still need an individual test, in their original order
+    """
+    candidates = []
+    base_lux = None
+    
+    for start in range(0, len(light_entities), SCREENING_GROUP_SIZE):
+        group = light_entities[start:start + SCREENING_GROUP_SIZE]
+        
+        try:
+            # Each group is switched back off below, so the all-off base is
+            # measured once and only re-measured after a failed switch
+            if base_lux is None:
+                await set_lights_func(False)
+                await asyncio.sleep(settle_time_seconds)
+                base_lux = await read_sensor_func()
+            
+            await asyncio.gather(*(set_light_func(light, 255) for light in group))
+            await asyncio.sleep(settle_time_seconds)
+            contribution = await read_sensor_func() - base_lux
+        except Exception as err:
+            _LOGGER.error("Failed to screen %s, testing individually: %s", group, err)
+            candidates.extend(group)
+            base_lux = None
+            continue
+        finally:
+            # On a recalibration set_lights_func only reaches the previous
+            # contributors, so the group is switched back off light by light;
+            # a light left on is folded into a freshly measured base
+            results = await asyncio.gather(
+                *(set_light_func(light, 0) for light in group),
+                return_exceptions=True
+            )
+            if any(isinstance(result, Exception) for result in results):
+                base_lux = None
+        
+        if contribution >= CONTRIBUTION_THRESHOLD_LUX:
+            candidates.extend(group)
+        else:
+            _LOGGER.info("✗ Group of %d lights contributes only %.1f lux - below threshold (IGNORED): %s",
+                        len(group), contribution, group)
+    
+    return candidates
+
 
 async def test_individual_light_contributions(
     hass: HomeAssistant,
@@ -33,11 +100,16 @@ async def test_individual_light_contributions(
     settle_time_seconds: int,
     set_lights_func: Callable,
     set_light_func: Callable,
-    read_sensor_func: Callable
+    read_sensor_func: Callable,
+    group_screening: bool = True
 ) -> Dict[str, Dict[str, Any]]:
     """
     Test each light individually to measure its contribution to room illumination.
     
+    With many lights (typically when neighbouring areas are included), lights
+    are first screened in small groups so that groups which cannot reach the
+    threshold skip their individual tests.
+    
     Args:
         hass: Home Assistant instance
         light_entities: List of light entity IDs to test
@@ -45,9 +117,10 @@ async def test_individual_light_contributions(
         set_lights_func: Async function to set all lights (state: bool) -> None
         set_light_func: Async function to set one light (entity_id: str, brightness: int) -> None
         read_sensor_func: Async function to read sensor value () -> float
+        group_screening: Screen large light sets in groups first (False tests every light)
         
     Returns:
-        Dictionary mapping entity_id to contribution data:
+        Dictionary mapping entity_id to contribution data, strongest light first:
         {
             "max_contribution": float,  # Lux contributed at full brightness
             "base_lux": float,          # Room lux with this light OFF
@@ -57,20 +130,55 @@ async def test_individual_light_contributions(
     """
     _LOGGER.info("Testing individual contributions for %d lights", len(light_entities))
     
+    lights_to_test = list(light_entities)
+    if group_screening and len(lights_to_test) >= SCREENING_MIN_LIGHTS:
+        lights_to_test = await _screen_light_groups(
+            lights_to_test,
+            settle_time_seconds,
+            set_lights_func,
+            set_light_func,
+            read_sensor_func
+        )
+        _LOGGER.info("Group screening kept %d of %d lights for individual testing",
+                    len(lights_to_test), len(light_entities))
+    
     light_contributions = {}
+    previous_light = None
+    base_lux = None
     
-    for i, light_entity in enumerate(light_entities):
-        _LOGGER.info("Testing light %d/%d: %s", i + 1, len(light_entities), light_entity)
+    for i, light_entity in enumerate(lights_to_test):
+        _LOGGER.debug("Testing light %d/%d: %s", i + 1, len(lights_to_test), light_entity)
         
         try:
-            # Turn off all lights
-            await set_lights_func(False)
-            await asyncio.sleep(settle_time_seconds)
-            base_lux = await read_sensor_func()
-            _LOGGER.debug("%s: Base lux (all OFF) = %.1f", light_entity, base_lux)
+            # The all-off base only drifts with ambient light, so it is measured
+            # once and then re-checked every few lights instead of per light
+            if base_lux is None or i % BASE_REFRESH_INTERVAL == 0:
+                if previous_light is None:
+                    await set_lights_func(False)
+                else:
+                    await set_light_func(previous_light, 0)
+                await asyncio.sleep(settle_time_seconds)
+                previous_light = None
+                base_lux = await read_sensor_func()
+                _LOGGER.debug("%s: Base lux (all OFF) = %.1f", light_entity, base_lux)
+            
+            # Turn on this light while the previous one turns off, sharing one settle
+            switches = [set_light_func(light_entity, 255)]
+            if previous_light is not None:
+                switches.append(set_light_func(previous_light, 0))
+            results = await asyncio.gather(*switches, return_exceptions=True)
+            stale_light, previous_light = previous_light, light_entity
+            
+            failures = [result for result in results if isinstance(result, Exception)]
+            if failures:
+                _LOGGER.error("Failed to switch lights while testing %s: %s", light_entity, failures)
+                # A previous light left on would skew every reading until the
+                # next base refresh, so force it off and re-measure the base
+                base_lux = None
+                if stale_light is not None:
+                    await set_light_func(stale_light, 0)
+                continue
             
-            # Turn on this specific light
-            await set_light_func(light_entity, 255)
             await asyncio.sleep(settle_time_seconds)
             with_light_lux = await read_sensor_func()
             _LOGGER.debug("%s: With light ON = %.1f", light_entity, with_light_lux)
@@ -95,6 +203,11 @@ async def test_individual_light_contributions(
             _LOGGER.error("Failed to test %s: %s", light_entity, err)
             # Continue with next light
     
+    # Order by contribution so later phases can take the strongest lights directly
+    light_contributions = dict(sorted(
+        light_contributions.items(), key=lambda item: -item[1]["max_contribution"]
+    ))
+    
     contributing_count = len(light_contributions)
     ignored_count = len(light_entities) - contributing_count
     
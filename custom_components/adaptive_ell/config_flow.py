@@ -12,7 +12,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import area_registry, entity_registry, device_registry, selector
 
-from .const import DOMAIN
+from .area_lights import async_get_area_lights
+from .const import DOMAIN, BAD_SENSOR_STATES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,28 +92,14 @@ async def _count_lights_in_areas(hass: HomeAssistant, area_ids: List[str]) -> in
     """Count lights in specified areas."""
     ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
-    light_count = 0
     
-    for entity in ent_reg.entities.values():
-        if not entity.entity_id.startswith("light."):
-            continue
-            
-        if entity.disabled:
-            continue
-            
-        # Get device area
-        entity_area_id = None
-        if entity.device_id:
-            device = dev_reg.devices.get(entity.device_id)
-            if device:
-                entity_area_id = device.area_id
-        
-        if entity_area_id in area_ids:
-            # Verify entity exists
-            if hass.states.get(entity.entity_id):
-                light_count += 1
-    
-    return light_count
+    # Only lights with a state (loaded by their integration) are counted
+    return sum(
+        1
+        for area_id in set(area_ids)
+        for light in async_get_area_lights(ent_reg, dev_reg, area_id)
+        if hass.states.get(light)
+    )
 
 
 def _check_existing_helper(hass: HomeAssistant, area_id: str) -> bool:
@@ -292,7 +279,7 @@ class AdaptiveELLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             sensor_state = self.hass.states.get(sensor_entity)
             if not sensor_state:
                 errors["sensor"] = "sensor_not_found"
-            elif sensor_state.state in ["unavailable", "unknown"]:
+            elif sensor_state.state in BAD_SENSOR_STATES:
                 errors["sensor"] = "sensor_unavailable"
             else:
                 self._sensor_entity = sensor_entity
@@ -1,4 +1,5 @@
 """Constants for Adaptive ELL integration."""
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
 DOMAIN = "adaptive_ell"
 
@@ -30,4 +31,7 @@ DATA_COORDINATOR = "coordinator"
 # Calibration constants
 CALIBRATION_SETTLE_TIME = 5  # seconds
 CALIBRATION_LUX_THRESHOLD = 10  # minimum lux change to record
+# Sensor states that carry no reading; the empty and "None" states some
+# integrations report are rejected here instead of by a failing float()
+BAD_SENSOR_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN, "None", ""})
 LIGHT_DISCOVERY_BRIGHTNESS = 50  # percent brightness for discovery
\ No newline at end of file
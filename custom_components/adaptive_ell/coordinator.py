@@ -15,17 +15,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Dict
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
-from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import area_registry, entity_registry, device_registry
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN
+from .area_lights import async_get_area_lights
+from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, CALIBRATION_LUX_THRESHOLD, BAD_SENSOR_STATES
 from .calibration_phases import restore_state
 from .calibration_phases import test_min_max
 from .calibration_phases import test_individual_lights
@@ -34,6 +38,20 @@ from .calibration_phases import save_calibration
 
 _LOGGER = logging.getLogger(__name__)
 
+# HA brightness is 0-255; multiply instead of dividing per light
+_INV_255 = 1.0 / 255.0
+
+# Registry changes that can move an entity into or out of an area's buckets
+_AREA_MEMBERSHIP_KEYS = frozenset({"area_id", "device_id", "disabled_by", "entity_id"})
+_LIGHT_PREFIX = f"{LIGHT_DOMAIN}."
+
+
+def _light_level(light_state) -> int:
+    """Return a light's brightness (0-255), counting anything not on as 0."""
+    if not light_state or light_state.state != STATE_ON:
+        return 0
+    return light_state.attributes.get("brightness", 255)
+
 
 class AdaptiveELLCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Adaptive ELL calibration and data."""
@@ -44,22 +62,31 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            # Heartbeat only - sensor and light changes are pushed via listeners,
+            # this just re-installs them if they were never set up
+            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            # Data is a plain dict, so unchanged pushes compare equal and are skipped
+            always_update=False,
         )
         
         self.config_entry = config_entry
         config_data = config_entry.options or config_entry.data
         test_area_id = config_data.get("test_area")
         
+        # Registries are long-lived singletons updated in place, so the handles
+        # never go stale and can be kept for the coordinator's lifetime
+        self._area_reg = area_registry.async_get(hass)
+        self._ent_reg = entity_registry.async_get(hass)
+        self._dev_reg = device_registry.async_get(hass)
+        
         if test_area_id:
-            area_reg = area_registry.async_get(hass)
-            area = area_reg.areas.get(test_area_id)
+            area = self._area_reg.areas.get(test_area_id)
             self.room_name = area.name if area else "Unknown"
         else:
             self.room_name = "Unconfigured"
         
         self.sensor_entity = config_data.get("sensor_entity")
-        self.lights = []
+        self.lights: tuple[str, ...] = ()
         self.excluded_lights = []
         
         # Load existing calibration data if available
@@ -71,6 +98,15 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         self.validation_results = existing_calibration.get("validation_results", {})
         self.settle_time_seconds = existing_calibration.get("settle_time_seconds", 0)
         
+        # Estimation inputs as parallel tuples (entity, weight at brightness 1)
+        self._contrib_entities: tuple[str, ...] = ()
+        self._contrib_weights: tuple[float, ...] = ()
+        # Last estimate, dropped whenever a tracked light or the weights change
+        self._estimated_lux: float | None = None
+        # Per-light "<name>_contribution" / "<name>_linear" sensor attributes
+        self.contribution_attributes: Dict[str, Any] = {}
+        self._rebuild_contribution_weights()
+        
         if self.light_contributions:
             _LOGGER.info("Loaded existing calibration data for %s: %d contributing lights", 
                         self.room_name, len(self.light_contributions))
@@ -83,38 +119,56 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         
         # State change listeners
         self._unsub_state_listeners = []
-        self._light_state_dirty = False
+        self._listener_entities: frozenset[str] = frozenset()
+        # Last numeric sensor reading seen by the listener, None when unknown,
+        # and the sensor it came from so a changed selection never reuses it
+        self._last_sensor_lux: float | None = None
+        self._last_sensor_entity: str | None = None
+        # Brightness of each tracked light, taken from the events' new states
+        self._light_levels: dict[str, int] = {}
+        # Bursts of changes (scenes, groups) coalesce into one push; the
+        # first change of a burst is still pushed immediately
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=0.3,
+            immediate=True,
+            function=self._async_push_data,
+        )
+        
+        # Sensor and area selection, reused across calibration runs until the
+        # entry's selection (not just its calibration data) changes
+        self._config_cache: Dict[str, Any] | None = None
+        # Enabled lights of each looked-up area, reused until the registries
+        # change which lights sit in which area
+        self._lights_by_area: dict[str, tuple[str, ...]] = {}
+        config_entry.async_on_unload(
+            config_entry.add_update_listener(self._async_config_entry_updated)
+        )
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        ):
+            config_entry.async_on_unload(
+                hass.bus.async_listen(event_type, self._async_registry_updated)
+            )
         
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data from Home Assistant."""
         try:
-            data = {
-                "calibrating": self.is_calibrating,
-                "calibration_step": self.calibration_step,
-                "min_lux": self.min_lux,
-                "max_lux": self.max_lux,
-                "lights_count": len(self.lights)
-            }
-            
-            if self.sensor_entity:
-                sensor_state = self.hass.states.get(self.sensor_entity)
-                if sensor_state and sensor_state.state not in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
-                    try:
-                        current_lux = float(sensor_state.state)
-                        data["current_lux"] = current_lux
-                        
-                        if self.light_contributions:
-                            estimated_lux = await self._calculate_current_estimated_lux()
-                            data["estimated_lux"] = estimated_lux
-                            
-                            if self._light_state_dirty:
-                                _LOGGER.debug("Light state changed, updated estimated lux: %.1f", estimated_lux)
-                                self._light_state_dirty = False
-                                
-                    except (ValueError, TypeError):
-                        pass
+            # Calibration is driving the lights, so an estimate now would be
+            # meaningless - keep the last values and refresh only the status
+            if self.is_calibrating:
+                return {**(self.data or {}), **self._status_data()}
+            
+            # Listeners push every sensor/light change, and calibration pushes
+            # its final state, so whatever was last pushed is still current
+            if self._unsub_state_listeners and self.data:
+                return self.data
+            
+            data = self._build_data()
             
-            if self.light_contributions and not self._unsub_state_listeners:
+            if self.sensor_entity and not self._unsub_state_listeners:
                 await self._setup_light_state_listeners()
             
             return data
@@ -122,29 +176,99 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         except Exception as err:
             raise UpdateFailed(f"Error updating data: {err}")
 
+    @callback
+    def _async_push_data(self) -> None:
+        """Push freshly built data to listeners if it changed."""
+        # Calibration may have started since the push was scheduled
+        if self.is_calibrating:
+            return
+        
+        data = self._build_data()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Pushing update, estimated lux: %s", data.get("estimated_lux"))
+        # async_set_updated_data always notifies, so apply always_update here too
+        if data != self.data:
+            self.async_set_updated_data(data)
+
+    def _status_data(self) -> Dict[str, Any]:
+        """Return the calibration status part of the coordinator data."""
+        return {
+            "calibrating": self.is_calibrating,
+            "calibration_step": self.calibration_step,
+            "min_lux": self.min_lux,
+            "max_lux": self.max_lux,
+            "lights_count": len(self.lights)
+        }
+
+    def _build_data(self) -> Dict[str, Any]:
+        """Build the coordinator data from the current sensor and light states."""
+        data = self._status_data()
+        
+        if self.sensor_entity:
+            # Kept current by the listener once it is running
+            current_lux = None
+            if self._last_sensor_entity == self.sensor_entity:
+                current_lux = self._last_sensor_lux
+            if current_lux is None:
+                sensor_state = self.hass.states.get(self.sensor_entity)
+                if sensor_state and (state := sensor_state.state) not in BAD_SENSOR_STATES:
+                    try:
+                        current_lux = float(state)
+                    except (ValueError, TypeError):
+                        pass
+            
+            if current_lux is not None:
+                data["current_lux"] = current_lux
+                
+                if self.light_contributions:
+                    if self._estimated_lux is None:
+                        self._estimated_lux = self._calculate_current_estimated_lux()
+                    data["estimated_lux"] = self._estimated_lux
+        
+        return data
+
     async def async_shutdown(self) -> None:
         """Cleanup when coordinator is shutting down."""
+        self._push_debouncer.async_cancel()
         await self._cleanup_state_listeners()
         await super().async_shutdown()
 
-    async def _calculate_current_estimated_lux(self) -> float:
-        """Calculate current estimated lux based on light states."""
-        total_estimated = 0
+    def _rebuild_contribution_weights(self) -> None:
+        """Fold each light's max contribution and the 1/255 scale into one weight."""
+        self._contrib_entities = tuple(self.light_contributions)
+        self._contrib_weights = tuple(
+            contrib_data.get("max_contribution", 0) * _INV_255
+            for contrib_data in self.light_contributions.values()
+        )
+        self._estimated_lux = None
         
+        # Per-light sensor attributes only change with the contributions
+        self.contribution_attributes = {}
         for light_entity, contrib_data in self.light_contributions.items():
-            light_state = self.hass.states.get(light_entity)
-            if not light_state or light_state.state != STATE_ON:
-                continue
-                
-            brightness = light_state.attributes.get("brightness", 255)
-            brightness_percent = brightness / 255.0
-            
-            max_contribution = contrib_data.get("max_contribution", 0)
-            current_contribution = max_contribution * brightness_percent
-            total_estimated += current_contribution
+            light_name = light_entity.rsplit(".", 1)[-1]
+            self.contribution_attributes[f"{light_name}_contribution"] = contrib_data.get("max_contribution", 0)
+            self.contribution_attributes[f"{light_name}_linear"] = contrib_data.get("linear_validated", False)
+
+    def _calculate_current_estimated_lux(self) -> float:
+        """Calculate current estimated lux based on light states."""
+        levels = self._light_levels
+        if not levels:
+            # Listeners not running, so nothing has recorded the levels yet
+            states_get = self.hass.states.get
+            levels = {light: _light_level(states_get(light)) for light in self._contrib_entities}
+        
+        total_estimated = 0
+        for light_entity, weight in zip(self._contrib_entities, self._contrib_weights):
+            total_estimated += weight * levels.get(light_entity, 0)
         
         return round(total_estimated, 1)
 
+    @callback
+    def _publish_step(self, step: str) -> None:
+        """Push a calibration step change to listeners without re-reading the sensor."""
+        self.calibration_step = step
+        self.async_set_updated_data({**(self.data or {}), **self._status_data()})
+
     async def _send_notification(self, title: str, message: str) -> None:
         """Send persistent notification."""
         try:
@@ -159,44 +283,81 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.warning("Failed to send notification: %s", err)
 
-    async def _get_configuration_from_options(self) -> Dict[str, Any]:
-        """Read configuration from config entry data."""
-        config_data = self.config_entry.options or self.config_entry.data
+    async def _async_config_entry_updated(self, hass: HomeAssistant, entry) -> None:
+        """Drop the cached configuration when the entry's sensor or area selection changes."""
+        # Saving a calibration updates the entry too, but leaves the selection as it was
+        if self._config_cache != self._read_configuration(entry):
+            self._config_cache = None
+
+    @callback
+    def _async_registry_updated(self, event) -> None:
+        """Drop the area buckets when a registry change may move lights between areas."""
+        event_data = event.data
+        if event_data.get("action") == "update" and _AREA_MEMBERSHIP_KEYS.isdisjoint(
+            event_data.get("changes", ())
+        ):
+            return
+        
+        # Only light entities are bucketed; device changes can move any of theirs
+        if event.event_type == entity_registry.EVENT_ENTITY_REGISTRY_UPDATED and not any(
+            entity_id and entity_id.startswith(_LIGHT_PREFIX)
+            for entity_id in (event_data.get("entity_id"), event_data.get("old_entity_id"))
+        ):
+            return
+        
+        self._lights_by_area.clear()
+
+    @staticmethod
+    def _read_configuration(config_entry) -> Dict[str, Any]:
+        """Read the sensor and area selection from a config entry."""
+        config_data = config_entry.options or config_entry.data
         
         test_area_id = config_data.get("test_area")
         additional_area_ids = config_data.get("selected_areas", [])
-        area_ids = [test_area_id] + additional_area_ids
         
-        _LOGGER.info("Loading config: test_area=%s, additional_areas=%s", test_area_id, additional_area_ids)
+        return {
+            "sensor_entity": config_data.get("sensor_entity"),
+            "area_ids": [test_area_id] + additional_area_ids
+        }
+
+    async def _get_configuration_from_options(self) -> Dict[str, Any]:
+        """Read configuration from config entry data."""
+        if self._config_cache is None:
+            self._config_cache = self._read_configuration(self.config_entry)
+        area_ids = self._config_cache["area_ids"]
         
-        area_reg = area_registry.async_get(self.hass)
-        ent_reg = entity_registry.async_get(self.hass)
-        dev_reg = device_registry.async_get(self.hass)
+        _LOGGER.debug("Loading config: areas=%s", area_ids)
         
+        # Resolved on every run, so lights that loaded since the last one are found
+        lights = self._get_lights_from_areas(area_ids)
+        
+        _LOGGER.debug("Found %d lights across %d areas", len(lights), len(area_ids))
+        
+        return {**self._config_cache, "lights": tuple(lights)}
+
+    def _get_lights_from_areas(self, area_ids: list[str]) -> list[str]:
+        """Return enabled, loaded light entities in one of the areas."""
+        lights_by_area = self._lights_by_area
+        
+        # Gathering in area order keeps the target area's lights first; only
+        # lights with a state (loaded by their integration) can be calibrated
+        states_get = self.hass.states.get
+        log_areas = _LOGGER.isEnabledFor(logging.DEBUG)
         lights = []
-        for entity in ent_reg.entities.values():
-            if not entity.entity_id.startswith("light."):
+        for area_id in area_ids:
+            if not area_id:
                 continue
-            if entity.disabled:
-                continue
-            
-            entity_area_id = None
-            if entity.device_id:
-                device = dev_reg.devices.get(entity.device_id)
-                if device:
-                    entity_area_id = device.area_id
-            
-            if entity_area_id in area_ids:
-                if self.hass.states.get(entity.entity_id):
-                    lights.append(entity.entity_id)
-        
-        _LOGGER.info("Found %d lights across %d areas", len(lights), len(area_ids))
+            area_lights = lights_by_area.get(area_id)
+            if area_lights is None:
+                area_lights = lights_by_area[area_id] = async_get_area_lights(
+                    self._ent_reg, self._dev_reg, area_id
+                )
+            area_lights = [light for light in area_lights if states_get(light) is not None]
+            if log_areas:
+                _LOGGER.debug("Area %s: %d lights", area_id, len(area_lights))
+            lights.extend(area_lights)
         
-        return {
-            "sensor_entity": config_data.get("sensor_entity"),
-            "lights": lights,
-            "area_ids": area_ids
-        }
+        return lights
 
     async def start_calibration_from_options(self) -> None:
         """Start calibration using configuration from config entry data."""
@@ -205,7 +366,7 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         
         config = await self._get_configuration_from_options()
         self.sensor_entity = config["sensor_entity"]
-        self.lights = config["lights"]
+        self.lights = tuple(config["lights"])
         self.excluded_lights = []
         
         if not self.sensor_entity or not self.lights:
@@ -240,14 +401,16 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
                      len(self.config_entry.data.get("selected_areas", [])) + 1)
         _LOGGER.error("Estimated time: %d minutes", self._estimate_calibration_time(len(self.lights)))
         
-        await self._send_notification(
+        self.hass.async_create_task(self._send_notification(
             "Calibration Starting",
             f"This will take approximately {self._estimate_calibration_time(len(self.lights))} minutes. "
             f"Lights will turn on/off automatically."
-        )
+        ))
         
+        # Set before the first await, so a second service call that arrives
+        # while this one runs is turned away by the is_calibrating check
         self.is_calibrating = True
-        self.calibration_step = "validation"
+        self._publish_step("validation")
         
         try:
             # PHASE 1: Capture initial states
@@ -264,8 +427,7 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             await self._calibrate_timing()
             
             # PHASE 4: Test min/max levels
-            self.calibration_step = "testing_min_max"
-            await self.async_request_refresh()
+            self._publish_step("testing_min_max")
             self.min_lux, self.max_lux = await test_min_max.test_min_max_levels(
                 self.hass,
                 self.sensor_entity,
@@ -276,8 +438,7 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             )
             
             # PHASE 5: Test individual light contributions
-            self.calibration_step = "testing_contributions"
-            await self.async_request_refresh()
+            self._publish_step("testing_contributions")
             self.light_contributions = await test_individual_lights.test_individual_light_contributions(
                 self.hass,
                 self.lights,
@@ -286,10 +447,10 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
                 self._set_light_to_white,
                 self._read_sensor
             )
+            self._rebuild_contribution_weights()
             
             # PHASE 6: Validate light pairs
-            self.calibration_step = "validating_pairs"
-            await self.async_request_refresh()
+            self._publish_step("validating_pairs")
             self.validation_results = await validate_combinations.validate_light_pair_additivity(
                 self.hass,
                 self.light_contributions,
@@ -299,9 +460,9 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
                 self._read_sensor
             )
             
-            # PHASE 7: Save calibration data
+            # PHASE 7: Save calibration data (finishes at once, so the step is
+            # not published on its own - "completed" follows immediately)
             self.calibration_step = "saving_data"
-            await self.async_request_refresh()
             save_success = await save_calibration.save_calibration_data(
                 self.hass,
                 self.config_entry,
@@ -320,11 +481,9 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             # Setup state listeners
             await self._setup_light_state_listeners()
             
-            self.calibration_step = "completed"
+            self._publish_step("completed")
             _LOGGER.error("=== CALIBRATION COMPLETED ===")
             
-            await self.async_request_refresh()
-            
             # Log summary
             contributing_lights = len(self.light_contributions)
             total_lights_tested = len(self.lights) - len(self.excluded_lights)
@@ -342,7 +501,7 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             
             if self.light_contributions:
                 try:
-                    current_estimated = await self._calculate_current_estimated_lux()
+                    current_estimated = self._calculate_current_estimated_lux()
                     _LOGGER.error("✓ Current estimated light level: %.1f lux", current_estimated)
                 except Exception as est_err:
                     _LOGGER.error("Failed to calculate current estimated lux: %s", est_err)
@@ -356,16 +515,16 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
             if self.excluded_lights:
                 notification_msg += f"\n\n⚠️ Excluded {len(self.excluded_lights)} non-responsive lights."
             
-            await self._send_notification("Calibration Complete!", notification_msg)
+            self.hass.async_create_task(self._send_notification("Calibration Complete!", notification_msg))
             
         except Exception as err:
             self.calibration_step = f"failed: {err}"
             _LOGGER.error("Calibration failed: %s", err)
             
-            await self._send_notification(
+            self.hass.async_create_task(self._send_notification(
                 "Calibration Failed",
                 f"Calibration of {self.room_name.title()} failed: {err}"
-            )
+            ))
             
             raise
             
@@ -387,7 +546,8 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Failed to restore light states: %s", restore_err)
             
             self.is_calibrating = False
-            await self.async_request_refresh()
+            # Publish the final state straight away rather than via a debounced refresh
+            self.async_set_updated_data(self._build_data())
 
     async def stop_calibration(self) -> None:
         """Stop the calibration process."""
@@ -403,24 +563,23 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to restore light states: %s", err)
         
-        await self._send_notification(
+        self.hass.async_create_task(self._send_notification(
             "Calibration Stopped",
             f"Calibration of {self.room_name.title()} was stopped by user."
-        )
+        ))
         
-        await self.async_request_refresh()
+        self.async_set_updated_data(self._build_data())
 
     # TODO: Extract these validation/setup methods to modules
     async def _validate_setup(self) -> None:
         """Validate sensor and lights are available."""
-        self.calibration_step = "validating_sensor"
-        await self.async_request_refresh()
+        self._publish_step("validating_sensor")
         
         sensor_state = self.hass.states.get(self.sensor_entity)
         if not sensor_state:
             raise HomeAssistantError(f"Sensor {self.sensor_entity} not found")
         
-        if sensor_state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
+        if sensor_state.state in BAD_SENSOR_STATES:
             raise HomeAssistantError(f"Sensor {self.sensor_entity} is unavailable")
         
         try:
@@ -429,8 +588,7 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         except (ValueError, TypeError):
             raise HomeAssistantError(f"Sensor {self.sensor_entity} has invalid value: {sensor_state.state}")
         
-        self.calibration_step = "validating_lights"
-        await self.async_request_refresh()
+        self._publish_step("validating_lights")
         
         working_lights = []
         failed_lights = []
@@ -453,22 +611,26 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         if failed_lights:
             _LOGGER.warning("Some lights failed validation: %s", failed_lights)
         
-        self.lights = working_lights
+        self.lights = tuple(working_lights)
         _LOGGER.info("Validated %d working lights", len(self.lights))
 
     async def _read_sensor(self) -> float:
         """Read current lux value from sensor."""
+        # The state listener keeps this current once it is running
+        if self._last_sensor_lux is not None and self._last_sensor_entity == self.sensor_entity:
+            return self._last_sensor_lux
+        
         sensor_state = self.hass.states.get(self.sensor_entity)
-        if not sensor_state or sensor_state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
+        if not sensor_state or (state := sensor_state.state) in BAD_SENSOR_STATES:
             raise HomeAssistantError(f"Sensor {self.sensor_entity} unavailable during reading")
         
         try:
-            return float(sensor_state.state)
+            return float(state)
         except (ValueError, TypeError):
-            raise HomeAssistantError(f"Invalid sensor reading: {sensor_state.state}")
+            raise HomeAssistantError(f"Invalid sensor reading: {state}")
 
-    async def _set_light_to_white(self, entity_id: str, brightness: int) -> None:
-        """Set a light to white at specified brightness."""
+    async def _set_light_to_white(self, entity_id: str | list[str], brightness: int) -> None:
+        """Set one light, or a list of lights in a single call, to white at specified brightness."""
         service_data = {
             "entity_id": entity_id,
             "brightness": brightness,
@@ -483,27 +645,56 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
     # TODO: Extract this to calibration_phases/calibrate_timing.py
     async def _calibrate_timing(self) -> None:
         """Calibrate optimal timing for light state changes."""
-        self.calibration_step = "calibrating_timing"
-        await self.async_request_refresh()
+        self._publish_step("calibrating_timing")
         
         timings = []
         test_light = self.lights[0]
         
         for _ in range(3):
             start_lux = await self._read_sensor()
+            responded = asyncio.Event()
+            recovered = asyncio.Event()
             
-            await self._set_light_to_white(test_light, 255)
-            
-            for wait_time in [1, 2, 3, 4, 5]:
-                await asyncio.sleep(1)
-                current_lux = await self._read_sensor()
-                if abs(current_lux - start_lux) > 10:
+            @callback
+            def sensor_changed(event, start_lux=start_lux, responded=responded, recovered=recovered):
+                """Flag the first reading past the threshold, then the return below it."""
+                new_state = event.data.get("new_state")
+                try:
+                    current_lux = float(new_state.state)
+                except (AttributeError, ValueError, TypeError):
+                    return
+                if abs(current_lux - start_lux) > CALIBRATION_LUX_THRESHOLD:
+                    responded.set()
+                elif responded.is_set():
+                    recovered.set()
+            
+            # React to the sensor's own state change instead of polling it once a second
+            unsub = async_track_state_change_event(self.hass, [self.sensor_entity], sensor_changed)
+            try:
+                started = time.monotonic()
+                await self._set_light_to_white(test_light, 255)
+                try:
+                    await asyncio.wait_for(responded.wait(), timeout=5)
+                    wait_time = time.monotonic() - started
                     timings.append(wait_time)
-                    _LOGGER.info("Light stabilized in %d seconds", wait_time)
-                    break
-            
-            await self._set_light_to_white(test_light, 0)
-            await asyncio.sleep(2)
+                    _LOGGER.info("Light stabilized in %.1f seconds", wait_time)
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("No sensor response from %s within 5 seconds", test_light)
+                
+                recovered.clear()
+                await self._set_light_to_white(test_light, 0)
+                
+                # Start the next trial as soon as the reading is back near its
+                # starting level, waiting at most the old fixed 2 second pause
+                try:
+                    if responded.is_set():
+                        await asyncio.wait_for(recovered.wait(), timeout=2)
+                    else:
+                        await asyncio.sleep(2)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                unsub()
         
         if timings:
             avg_timing = sum(timings) / len(timings)
@@ -514,63 +705,142 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
         _LOGGER.info("Using settle time: %d seconds", self.settle_time_seconds)
 
     async def _setup_light_state_listeners(self) -> None:
-        """Set up state change listeners for contributing lights."""
+        """Set up state change listeners for the sensor and contributing lights."""
+        tracked_entities = frozenset(self._contrib_entities)
+        if self.sensor_entity:
+            tracked_entities |= {self.sensor_entity}
+        
+        # A recalibration usually finds the same lights; the running listeners
+        # (and the readings they keep current) can then stay as they are
+        if self._unsub_state_listeners and tracked_entities == self._listener_entities:
+            _LOGGER.debug("State listeners already track the same %d entities", len(tracked_entities))
+            return
+        
         await self._cleanup_state_listeners()
         
-        if not self.light_contributions:
+        if not tracked_entities:
             return
             
         _LOGGER.info("Setting up state listeners for %d contributing lights", len(self.light_contributions))
         
-        from homeassistant.helpers.event import async_track_state_change_event
+        # Compare events against the sensor this listener was set up for
+        sensor_entity = self.sensor_entity
         
+        @callback
         def light_state_changed(event):
-            """Handle light state change - simple flag approach."""
-            entity_id = event.data.get("entity_id")
-            _LOGGER.debug("Contributing light %s changed, flagging for update", entity_id)
-            self._light_state_dirty = True
+            """Record the new reading and schedule a push to listeners."""
+            if event.data.get("entity_id") == sensor_entity:
+                self._last_sensor_entity = sensor_entity
+                try:
+                    self._last_sensor_lux = float(event.data["new_state"].state)
+                except (AttributeError, ValueError, TypeError):
+                    self._last_sensor_lux = None
+            else:
+                self._light_levels[event.data.get("entity_id")] = _light_level(event.data.get("new_state"))
+                self._estimated_lux = None
+            
+            # Calibration drives lights itself and publishes its own progress,
+            # including the final state once it ends
+            if self.is_calibrating:
+                return
+            
+            _LOGGER.debug("Tracked entity %s changed", event.data.get("entity_id"))
+            self._push_debouncer.async_schedule_call()
         
-        contributing_entities = list(self.light_contributions.keys())
         unsub = async_track_state_change_event(
             self.hass,
-            contributing_entities,
+            list(tracked_entities),
             light_state_changed
         )
         self._unsub_state_listeners.append(unsub)
+        self._listener_entities = tracked_entities
         
-        _LOGGER.info("State listeners set up for contributing lights")
+        # Seed the cached readings so they are valid before anything next changes
+        states_get = self.hass.states.get
+        self._light_levels = {light: _light_level(states_get(light)) for light in self._contrib_entities}
+        if sensor_entity and (sensor_state := states_get(sensor_entity)):
+            self._last_sensor_entity = sensor_entity
+            try:
+                self._last_sensor_lux = float(sensor_state.state)
+            except (ValueError, TypeError):
+                pass
+        
+        _LOGGER.info("State listeners set up for sensor and contributing lights")
 
     async def _cleanup_state_listeners(self) -> None:
         """Clean up state change listeners."""
-        count = len(self._unsub_state_listeners)
-        for unsub in self._unsub_state_listeners:
-            unsub()
-        self._unsub_state_listeners.clear()
+        # Swap the list out first so nothing sees half-removed listeners
+        listeners, self._unsub_state_listeners = self._unsub_state_listeners, []
+        count = len(listeners)
+        for unsub in listeners:
+            try:
+                unsub()
+            except Exception:
+                # Keep removing the rest even if one was already gone
+                _LOGGER.debug("Failed to remove state listener", exc_info=True)
+        self._listener_entities = frozenset()
+        # Nothing keeps the cached readings or estimate current any more
+        self._last_sensor_lux = None
+        self._last_sensor_entity = None
+        self._light_levels = {}
+        self._estimated_lux = None
         if count > 0:
             _LOGGER.debug("Cleaned up %d state listeners", count)
 
     async def _set_all_lights(self, state: bool) -> None:
         """Turn all contributing lights on (white) or off with validation."""
-        if hasattr(self, 'light_contributions') and self.light_contributions:
-            lights_to_control = list(self.light_contributions.keys())
-        else:
-            lights_to_control = self.lights
+        # The contributing lights are kept as a tuple alongside their weights
+        lights_to_control = self._contrib_entities or self.lights
             
         brightness = 255 if state else 0
         expected_state = STATE_ON if state else STATE_OFF
         
+        states_get = self.hass.states.get
+        remaining = {
+            light for light in lights_to_control
+            if (current_state := states_get(light)) is None or current_state.state != expected_state
+        }
+        
+        # Nothing to switch (and no settle to wait for) if every light already reports off
+        if not state and not remaining:
+            _LOGGER.debug("All %d lights already off, skipping turn_off", len(lights_to_control))
+            return
+        
         _LOGGER.info("Setting %d lights to %s...", len(lights_to_control), expected_state)
         
-        tasks = [self._set_light_to_white(light, brightness) for light in lights_to_control]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        all_switched = asyncio.Event()
         
-        await asyncio.sleep(2)
+        @callback
+        def light_switched(event):
+            """Tick off lights as they report the expected state."""
+            new_state = event.data.get("new_state")
+            if new_state is not None and new_state.state == expected_state:
+                remaining.discard(event.data.get("entity_id"))
+                if not remaining:
+                    all_switched.set()
         
-        failed_lights = []
-        for light in lights_to_control:
-            current_state = self.hass.states.get(light)
-            if not current_state or current_state.state != expected_state:
-                failed_lights.append(light)
+        # Subscribe before switching so no state change can slip past
+        unsub = async_track_state_change_event(self.hass, list(remaining), light_switched)
+        try:
+            # light.turn_on/turn_off accept an entity list, so one call covers every light
+            try:
+                await self._set_light_to_white(list(lights_to_control), brightness)
+            except Exception as err:
+                # Non-responsive lights are picked up by the state check below
+                _LOGGER.warning("Service call to set lights %s failed: %s", expected_state, err)
+            
+            # Wait for the lights to report their new state, giving slow ones
+            # up to the old fixed 2 seconds
+            if remaining:
+                try:
+                    await asyncio.wait_for(all_switched.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            unsub()
+        
+        # Lights still pending never reported the expected state
+        failed_lights = [light for light in lights_to_control if light in remaining]
         
         if failed_lights:
             _LOGGER.warning("⚠️ Excluding %d non-responsive lights from calibration: %s", 
@@ -580,11 +850,13 @@ class AdaptiveELLCoordinator(DataUpdateCoordinator):
                 if light not in self.excluded_lights:
                     self.excluded_lights.append(light)
                     
-            self.lights = [light for light in self.lights if light not in failed_lights]
+            failed_set = frozenset(failed_lights)
+            self.lights = tuple(light for light in self.lights if light not in failed_set)
             
             if hasattr(self, 'light_contributions') and self.light_contributions:
                 for light in failed_lights:
                     self.light_contributions.pop(light, None)
+                self._rebuild_contribution_weights()
             
             if not self.lights:
                 raise HomeAssistantError("All lights failed to respond. Cannot proceed with calibration.")
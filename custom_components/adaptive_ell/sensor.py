@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,7 +10,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import LIGHT_LUX
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -20,6 +20,32 @@ from .coordinator import AdaptiveELLCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Friendly names and progress for the coordinator's calibration steps
+_STEP_NAMES: Final = {
+    "validation": "🔍 Validating Setup...",
+    "validating_sensor": "📊 Checking Sensor...",
+    "validating_lights": "💡 Checking Lights...",
+    "calibrating_timing": "⏱️ Testing Timing...",
+    "testing_min_max": "📈 Testing Min/Max Values...",
+    "testing_contributions": "🧪 Testing Light Contributions...",
+    "validating_pairs": "✅ Validating Results...",
+    "saving_data": "💾 Saving Calibration Data...",
+    "completed": "✅ Calibration Complete!",
+    "stopped": "ℹ️ Calibration Stopped"
+}
+_STEP_PROGRESS: Final = {
+    "validation": 10,
+    "validating_sensor": 15,
+    "validating_lights": 20,
+    "calibrating_timing": 30,
+    "testing_min_max": 40,
+    "testing_contributions": 80,
+    "validating_pairs": 90,
+    "saving_data": 95,
+    "completed": 100,
+}
+_FAILED_PREFIX: Final = "failed:"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -55,12 +81,15 @@ class AdaptiveELLSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = LIGHT_LUX
         self._attr_icon = "mdi:lightbulb-on"
+        # Attributes built from the last coordinator update, None until read
+        self._cached_attributes: dict[str, Any] | None = None
+        # Set here and on each coordinator update rather than on every read
+        self._attr_native_value = self._estimated_lux()
         
         _LOGGER.info("Created ELL sensor: %s (ID: %s)", self._attr_name, self._attr_unique_id)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the estimated light level."""
+    def _estimated_lux(self) -> float | None:
+        """Return the estimated light level from the coordinator data."""
         if not self.coordinator.data:
             _LOGGER.debug("No coordinator data for %s", self._attr_name)
             return None
@@ -69,12 +98,23 @@ class AdaptiveELLSensor(CoordinatorEntity, SensorEntity):
         _LOGGER.debug("ELL sensor %s returning: %s", self._attr_name, estimated)
         return estimated
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take the new value and drop the cached attributes before writing the new state."""
+        self._attr_native_value = self._estimated_lux()
+        self._cached_attributes = None
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if not self.coordinator.data:
             return {}
         
+        # Everything below only changes with a coordinator update
+        if self._cached_attributes is not None:
+            return self._cached_attributes
+        
         data = self.coordinator.data
         
         # Check if configured
@@ -91,13 +131,10 @@ class AdaptiveELLSensor(CoordinatorEntity, SensorEntity):
             "calibration_status": "completed" if self.coordinator.light_contributions else "not_calibrated",
         }
         
-        # Add light contributions if calibrated
-        if self.coordinator.light_contributions:
-            for light_entity, contrib in self.coordinator.light_contributions.items():
-                light_name = light_entity.split(".")[-1]
-                attributes[f"{light_name}_contribution"] = contrib.get("max_contribution", 0)
-                attributes[f"{light_name}_linear"] = contrib.get("linear_validated", False)
+        # Add light contributions if calibrated (built once per calibration)
+        attributes.update(self.coordinator.contribution_attributes)
         
+        self._cached_attributes = attributes
         return attributes
 
 
@@ -113,9 +150,12 @@ class AdaptiveELLCalibrationSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"Adaptive ELL {room_name.title()} Calibration"
         self._attr_unique_id = f"adaptive_ell_{room_name.lower().replace(' ', '_')}_calibration"
         self._attr_icon = "mdi:tune"
+        # Attributes built from the last coordinator update, None until read
+        self._cached_attributes: dict[str, Any] | None = None
+        # Set here and on each coordinator update rather than on every read
+        self._attr_native_value = self._calibration_status()
 
-    @property
-    def native_value(self) -> str:
+    def _calibration_status(self) -> str:
         """Return the calibration status with progress indication."""
         if not self.coordinator.data:
             return "Unknown"
@@ -126,26 +166,12 @@ class AdaptiveELLCalibrationSensor(CoordinatorEntity, SensorEntity):
         
         if self.coordinator.data.get("calibrating"):
             step = self.coordinator.data.get("calibration_step", "calibrating")
-            # Make step names user-friendly with progress indication
-            step_names = {
-                "validation": "🔍 Validating Setup...",
-                "validating_sensor": "📊 Checking Sensor...",
-                "validating_lights": "💡 Checking Lights...", 
-                "calibrating_timing": "⏱️ Testing Timing...",
-                "testing_min_max": "📈 Testing Min/Max Values...",
-                "testing_contributions": "🧪 Testing Light Contributions...",
-                "validating_pairs": "✅ Validating Results...",
-                "saving_data": "💾 Saving Calibration Data...",
-                "completed": "✅ Calibration Complete!",
-                "stopped": "ℹ️ Calibration Stopped"
-            }
-            friendly_name = step_names.get(step, f"🔄 {step}...")
-            
             # Add failure indication
-            if step.startswith("failed:"):
-                return f"❌ Failed: {step[7:]}"
+            if step.startswith(_FAILED_PREFIX):
+                return f"❌ Failed: {step[len(_FAILED_PREFIX):]}"
             
-            return friendly_name
+            # Make step names user-friendly with progress indication
+            return _STEP_NAMES.get(step, f"🔄 {step}...")
         
         if self.coordinator.light_contributions:
             contrib_count = len(self.coordinator.light_contributions)
@@ -153,12 +179,23 @@ class AdaptiveELLCalibrationSensor(CoordinatorEntity, SensorEntity):
         
         return "❓ Ready for Calibration"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take the new status and drop the cached attributes before writing the new state."""
+        self._attr_native_value = self._calibration_status()
+        self._cached_attributes = None
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return calibration details with progress information."""
         if not self.coordinator.data:
             return {}
         
+        # Everything below only changes with a coordinator update
+        if self._cached_attributes is not None:
+            return self._cached_attributes
+        
         data = self.coordinator.data
         
         # Check if configured
@@ -177,18 +214,7 @@ class AdaptiveELLCalibrationSensor(CoordinatorEntity, SensorEntity):
         # Add progress percentage if calibrating
         if data.get("calibrating"):
             step = data.get("calibration_step", "idle")
-            step_progress = {
-                "validation": 10,
-                "validating_sensor": 15,
-                "validating_lights": 20,
-                "calibrating_timing": 30,
-                "testing_min_max": 40,
-                "testing_contributions": 80,
-                "validating_pairs": 90,
-                "saving_data": 95,
-                "completed": 100,
-            }
-            attributes["progress_percent"] = step_progress.get(step, 0)
+            attributes["progress_percent"] = _STEP_PROGRESS.get(step, 0)
         
         # Add validation results if available
         if hasattr(self.coordinator, 'validation_results') and self.coordinator.validation_results:
@@ -211,4 +237,5 @@ class AdaptiveELLCalibrationSensor(CoordinatorEntity, SensorEntity):
         if not is_configured:
             attributes["configuration_instructions"] = "Go to Settings > Devices & Services > Adaptive ELL > Configure"
         
+        self._cached_attributes = attributes
         return attributes
\ No newline at end of file